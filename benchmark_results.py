@@ -0,0 +1,77 @@
+import json
+import random
+import timeit
+import tracemalloc
+
+from models import StockResult, StockTable
+
+# Synthetic rows shaped like a state-wide "All" blood group search
+CATEGORIES = ["Govt.", "Private", "Red Cross", "Charitable/Vol"]
+ROW_COUNT = 5000
+REPEAT = 20
+
+def make_rows(count: int) -> list:
+    rng = random.Random(42)
+    rows = []
+    for i in range(count):
+        rows.append((
+            f"Blood Bank {i}, Some Road, Some City",
+            rng.choice(CATEGORIES),
+            f"Available, O+Ve:{rng.randint(0, 50)}, A+Ve:{rng.randint(0, 50)}",
+            f"2024-01-{rng.randint(1, 28):02d} 10:00:00",
+        ))
+    return rows
+
+def build_models(rows: list) -> list:
+    # Copies the strings so interning effects are visible, as with scraped text
+    return [
+        StockResult(
+            blood_bank_name="".join(name),
+            category="".join(category),
+            availability="".join(availability),
+            last_updated="".join(last_updated)
+        )
+        for name, category, availability, last_updated in rows
+    ]
+
+def build_table(rows: list) -> StockTable:
+    table = StockTable()
+    for name, category, availability, last_updated in rows:
+        table.append("".join(name), "".join(category), "".join(availability), "".join(last_updated))
+    return table
+
+def measure_memory(builder, rows: list) -> int:
+    tracemalloc.start()
+    result = builder(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+def main():
+    rows = make_rows(ROW_COUNT)
+    models = build_models(rows)
+    table = build_table(rows)
+
+    assert json.dumps([s.model_dump() for s in models], indent=2) == table.to_json("json")
+
+    print(f"Rows: {ROW_COUNT}, repeats: {REPEAT}\n")
+
+    print("--- Memory ---")
+    print(f"List[StockResult]: {measure_memory(build_models, rows) / 1024:.1f} KiB")
+    print(f"StockTable:        {measure_memory(build_table, rows) / 1024:.1f} KiB")
+
+    print("\n--- Serialization (ms per call) ---")
+    timings = {
+        "model_dump + indent=2 (current)": lambda: json.dumps([s.model_dump() for s in models], indent=2),
+        "StockTable json": lambda: table.to_json("json"),
+        "StockTable compact": lambda: table.to_json("compact"),
+        "StockTable table": lambda: table.to_json("table"),
+    }
+    for label, fn in timings.items():
+        elapsed = timeit.timeit(fn, number=REPEAT) / REPEAT * 1000
+        size = len(fn())
+        print(f"{label:<34} {elapsed:8.2f} ms  {size / 1024:8.1f} KiB")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from typing import TypedDict, List, Dict, Any, Optional
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
-from models import BloodGroup, StockResult
+from models import BloodGroup, StockTable
 from utils import fuzzy_match_state, fuzzy_match_district
 from scraper import ERaktKoshScraper
 
@@ -17,7 +17,7 @@ class AgentState(TypedDict):
     normalized_bg_code: Optional[str]
     normalized_bc_code: Optional[str]
     ambiguity_candidates: Optional[List[Dict]]
-    stock_results: Optional[List[StockResult]]
+    stock_results: Optional[StockTable]
     error: Optional[str]
     hierarchy: Dict # Injected from context
 
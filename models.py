@@ -1,6 +1,8 @@
+import json
+import sys
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 
 class BloodGroup(str, Enum):
     A_POS = "11"
@@ -20,7 +22,63 @@ class StockResult(BaseModel):
     category: str
     availability: str
     last_updated: str
-    
+
+STOCK_FIELDS = ("blood_bank_name", "category", "availability", "last_updated")
+
+class StockTable:
+    """
+    Columnar (struct-of-arrays) container for scraped stock rows.
+    Category and last_updated repeat heavily across rows, so they are interned.
+    StockResult models are only built on demand at the API boundary.
+    """
+    __slots__ = ("blood_bank_name", "category", "availability", "last_updated")
+
+    def __init__(self):
+        self.blood_bank_name: List[str] = []
+        self.category: List[str] = []
+        self.availability: List[str] = []
+        self.last_updated: List[str] = []
+
+    def append(self, blood_bank_name: str, category: str, availability: str, last_updated: str):
+        self.blood_bank_name.append(blood_bank_name)
+        self.category.append(sys.intern(category))
+        self.availability.append(availability)
+        self.last_updated.append(sys.intern(last_updated))
+
+    def __len__(self) -> int:
+        return len(self.blood_bank_name)
+
+    def __iter__(self) -> Iterator[StockResult]:
+        for row in self.rows():
+            yield StockResult(**dict(zip(STOCK_FIELDS, row)))
+
+    def rows(self) -> Iterator[tuple]:
+        return zip(self.blood_bank_name, self.category, self.availability, self.last_updated)
+
+    def to_results(self) -> List[StockResult]:
+        return list(self)
+
+    def to_dicts(self) -> List[Dict[str, str]]:
+        return [dict(zip(STOCK_FIELDS, row)) for row in self.rows()]
+
+    def to_json(self, output_format: str = "json") -> str:
+        """
+        Serializes the table without going through pydantic.
+        - "json": pretty-printed list of objects (original tool output)
+        - "compact": minified list of objects
+        - "table": minified {"columns": [...], "rows": [[...], ...]}
+        """
+        if output_format == "json":
+            return json.dumps(self.to_dicts(), indent=2)
+        if output_format == "compact":
+            return json.dumps(self.to_dicts(), separators=(",", ":"))
+        if output_format == "table":
+            return json.dumps(
+                {"columns": STOCK_FIELDS, "rows": list(self.rows())},
+                separators=(",", ":")
+            )
+        raise ValueError(f"Unknown output format '{output_format}'")
+
 class ScrapedHierarchy(BaseModel):
     states: dict[str, str] # id -> name
     districts: dict[str, dict[str, str]] # state_id -> {district_id -> district_name}
@@ -1,7 +1,7 @@
 import asyncio
 from playwright.async_api import async_playwright, Page, BrowserContext
 from typing import List, Dict, Optional
-from models import StockResult, BloodGroup
+from models import StockTable, BloodGroup
 
 URL = "https://eraktkosh.mohfw.gov.in/BLDAHIMS/bloodbank/stockAvailability.cnt"
 
@@ -106,9 +106,9 @@ class ERaktKoshScraper:
         finally:
             await page.close()
 
-    async def fetch_stock(self, state_code: str, district_code: str, blood_group_code: str, blood_component_code: str) -> List[StockResult]:
+    async def fetch_stock(self, state_code: str, district_code: str, blood_group_code: str, blood_component_code: str) -> StockTable:
         page = await self.context.new_page()
-        results = []
+        results = StockTable()
         try:
             await page.goto(URL, wait_until="domcontentloaded")
             
@@ -139,13 +139,13 @@ class ERaktKoshScraper:
                 await page.wait_for_selector("#example-table tbody tr td:nth-child(2), #cphMst_lblMsg", timeout=30000)
             except:
                 print("Timeout waiting for results.")
-                return [] # Timeout or nothing found
+                return StockTable() # Timeout or nothing found
 
             # Check for error/no records
             if await page.locator("#cphMst_lblMsg").is_visible():
                 text = await page.locator("#cphMst_lblMsg").inner_text()
                 if "not found" in text.lower():
-                    return []
+                    return StockTable()
 
             # Parse Table and Pagination
             page_count = 0
@@ -163,12 +163,12 @@ class ERaktKoshScraper:
                         availability = await cols[3].inner_text()
                         last_updated = await cols[4].inner_text()
                         
-                        results.append(StockResult(
-                            blood_bank_name=name.strip(),
-                            category=category.strip(),
-                            availability=availability.strip(),
-                            last_updated=last_updated.strip()
-                        ))
+                        results.append(
+                            name.strip(),
+                            category.strip(),
+                            availability.strip(),
+                            last_updated.strip()
+                        )
                 
                 page_count += 1
                 if page_count >= 5:  # Safety limit
@@ -196,6 +196,6 @@ class ERaktKoshScraper:
             
         except Exception as e:
             print(f"Error scraping stock: {e}")
-            return []
+            return StockTable()
         finally:
             await page.close()
@@ -8,7 +8,7 @@ from starlette.responses import JSONResponse
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 
-from models import BloodGroup, StockResult
+from models import BloodGroup
 from scraper import ERaktKoshScraper
 from utils import save_hierarchy, load_hierarchy, fuzzy_match_state, fuzzy_match_district
 from graph import app as agent_graph
@@ -95,11 +95,15 @@ async def _normalize_location(location_query: str) -> Dict[str, str]:
         
     return {"error": "Location not found", "confidence": str(max(s_score, best_d_score))}
 
-async def _fetch_stock(location_query: str, blood_group: str, blood_component: str = "Packed Red Blood Cells") -> str:
+async def _fetch_stock(location_query: str, blood_group: str, blood_component: str = "Packed Red Blood Cells", output_format: str = "json") -> str:
     # 1. Normalize Blood Group and Component
     # Handle explicit None passed from tool wrapper
     if blood_component is None:
         blood_component = "Packed Red Blood Cells"
+    if output_format is None:
+        output_format = "json"
+    if output_format not in ("json", "compact", "table"):
+        return f"Error: Unknown output format '{output_format}'. Use 'json', 'compact' or 'table'."
 
     bg_code = blood_group
     bc_code = blood_component
@@ -138,7 +142,7 @@ async def _fetch_stock(location_query: str, blood_group: str, blood_component: s
         
     stock = result.get("stock_results")
     if stock:
-        return json.dumps([s.model_dump() for s in stock], indent=2)
+        return stock.to_json(output_format)
         
     return "No stock found."
 
@@ -151,7 +155,7 @@ async def normalize_location(location_query: str) -> Dict[str, str]:
     return await _normalize_location(location_query)
 
 @mcp.tool()
-async def fetch_stock(location_query: str, blood_group: str, blood_component: str = None) -> str:
+async def fetch_stock(location_query: str, blood_group: str, blood_component: str = None, output_format: str = None) -> str:
     """
     Fetches real-time blood stock availability.
     
@@ -159,8 +163,10 @@ async def fetch_stock(location_query: str, blood_group: str, blood_component: st
         location_query: City, District, or State name (e.g., "Pune", "Delhi")
         blood_group: Blood group name (e.g., "O+", "A Positive")
         blood_component: Optional blood component (e.g., "Whole Blood", "Plasma", "Platelets")
+        output_format: Optional response format: "json" (default, pretty-printed),
+            "compact" (minified objects) or "table" (columns header plus rows)
     """
-    return await _fetch_stock(location_query, blood_group, blood_component)
+    return await _fetch_stock(location_query, blood_group, blood_component, output_format)
 
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):